@@ -4,6 +4,96 @@ Pytest configuration and shared fixtures
 import sys
 from pathlib import Path
 
+import pytest
+from fastapi.testclient import TestClient
+
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+from src.app import app, activities  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app"""
+    # Entering the client runs the app's lifespan once for the whole session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Original activities state, restored before each test
+_ORIGINAL_ACTIVITIES = {
+    "Basketball": {
+        "description": "Play basketball and develop shooting and teamwork skills",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["alex@mergington.edu"]
+    },
+    "Soccer": {
+        "description": "Competitive soccer matches and practice sessions",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 22,
+        "participants": ["james@mergington.edu"]
+    },
+    "Art Club": {
+        "description": "Explore painting, drawing, and visual arts techniques",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["lucy@mergington.edu"]
+    },
+    "Theater": {
+        "description": "Perform in school plays and develop acting skills",
+        "schedule": "Mondays and Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": ["sarah@mergington.edu", "tom@mergington.edu"]
+    },
+    "Debate Club": {
+        "description": "Develop argumentation and public speaking skills through debates",
+        "schedule": "Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 16,
+        "participants": ["robert@mergington.edu"]
+    },
+    "Science Club": {
+        "description": "Conduct experiments and explore scientific concepts",
+        "schedule": "Tuesdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["maya@mergington.edu", "chris@mergington.edu"]
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+
+def _fresh_activity(name):
+    """Return a copy of an original activity with its own participants list"""
+    original = _ORIGINAL_ACTIVITIES[name]
+    return {**original, "participants": list(original["participants"])}
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities data before each test that depends on participants"""
+    # Tests only mutate participant lists, so restore just the ones that changed
+    for name, original in _ORIGINAL_ACTIVITIES.items():
+        activity = activities.get(name)
+        if activity is None:
+            activities[name] = _fresh_activity(name)
+        elif activity["participants"] != original["participants"]:
+            activity["participants"] = list(original["participants"])
@@ -2,86 +2,10 @@
 Tests for the Mergington High School Activities API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import activities
 
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Basketball": {
-            "description": "Play basketball and develop shooting and teamwork skills",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Soccer": {
-            "description": "Competitive soccer matches and practice sessions",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["james@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore painting, drawing, and visual arts techniques",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["lucy@mergington.edu"]
-        },
-        "Theater": {
-            "description": "Perform in school plays and develop acting skills",
-            "schedule": "Mondays and Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["sarah@mergington.edu", "tom@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop argumentation and public speaking skills through debates",
-            "schedule": "Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 16,
-            "participants": ["robert@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Tuesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["maya@mergington.edu", "chris@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+BASKETBALL_SIGNUP = "/activities/Basketball/signup"
+BASKETBALL_UNREGISTER = "/activities/Basketball/unregister"
 
 
 class TestRootEndpoint:
@@ -122,13 +46,15 @@ class TestGetActivities:
         assert isinstance(basketball["participants"], list)
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
     def test_signup_new_participant(self, client):
         """Test signing up a new participant"""
         response = client.post(
-            "/activities/Basketball/signup?email=newstudent@mergington.edu"
+            BASKETBALL_SIGNUP,
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         
@@ -137,39 +63,31 @@ class TestSignupForActivity:
         assert "newstudent@mergington.edu" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Basketball"]["participants"]
+        assert "newstudent@mergington.edu" in activities["Basketball"]["participants"]
     
     def test_signup_duplicate_participant(self, client):
         """Test that signing up the same participant twice fails"""
         email = "duplicate@mergington.edu"
         
         # First signup should succeed
-        response1 = client.post(f"/activities/Basketball/signup?email={email}")
+        response1 = client.post(BASKETBALL_SIGNUP, params={"email": email})
         assert response1.status_code == 200
         
         # Second signup should fail
-        response2 = client.post(f"/activities/Basketball/signup?email={email}")
+        response2 = client.post(BASKETBALL_SIGNUP, params={"email": email})
         assert response2.status_code == 400
         assert "already signed up" in response2.json()["detail"]
     
-    def test_signup_nonexistent_activity(self, client):
-        """Test signing up for a nonexistent activity"""
-        response = client.post(
-            "/activities/NonexistentActivity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
     def test_signup_with_special_characters_in_activity_name(self, client):
-        """Test signing up with URL encoding in activity name"""
+        """Test signing up for an activity whose name needs URL encoding"""
         response = client.post(
-            "/activities/Art%20Club/signup?email=artist@mergington.edu"
+            "/activities/Art Club/signup",
+            params={"email": "artist@mergington.edu"}
         )
         assert response.status_code == 200
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
     
@@ -177,10 +95,10 @@ class TestUnregisterFromActivity:
         """Test unregistering an existing participant"""
         # First, sign up a participant
         email = "temp@mergington.edu"
-        client.post(f"/activities/Basketball/signup?email={email}")
+        client.post(BASKETBALL_SIGNUP, params={"email": email})
         
         # Then unregister them
-        response = client.delete(f"/activities/Basketball/unregister?email={email}")
+        response = client.delete(BASKETBALL_UNREGISTER, params={"email": email})
         assert response.status_code == 200
         
         data = response.json()
@@ -188,40 +106,41 @@ class TestUnregisterFromActivity:
         assert email in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Basketball"]["participants"]
-    
-    def test_unregister_nonexistent_participant(self, client):
-        """Test unregistering a participant who is not signed up"""
-        response = client.delete(
-            "/activities/Basketball/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"]
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregistering from a nonexistent activity"""
-        response = client.delete(
-            "/activities/NonexistentActivity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert email not in activities["Basketball"]["participants"]
     
     def test_unregister_initial_participant(self, client):
         """Test unregistering one of the initial participants"""
         # alex@mergington.edu is initially in Basketball
         response = client.delete(
-            "/activities/Basketball/unregister?email=alex@mergington.edu"
+            BASKETBALL_UNREGISTER,
+            params={"email": "alex@mergington.edu"}
         )
         assert response.status_code == 200
         
         # Verify removal
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" not in activities_data["Basketball"]["participants"]
+        assert "alex@mergington.edu" not in activities["Basketball"]["participants"]
+
+
+@pytest.mark.usefixtures("reset_activities")
+class TestErrorResponses:
+    """Tests for error responses shared by the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("method,path,email,status_code,detail", [
+        ("POST", "/activities/NonexistentActivity/signup",
+         "test@mergington.edu", 404, "Activity not found"),
+        ("DELETE", "/activities/NonexistentActivity/unregister",
+         "test@mergington.edu", 404, "Activity not found"),
+        ("DELETE", BASKETBALL_UNREGISTER,
+         "notregistered@mergington.edu", 400, "not signed up"),
+    ])
+    def test_error_response(self, client, method, path, email, status_code, detail):
+        """Test that invalid requests return the expected status and detail"""
+        response = client.request(method, path, params={"email": email})
+        assert response.status_code == status_code
+        assert detail in response.json()["detail"]
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegrationScenarios:
     """Integration tests for common user scenarios"""
     
@@ -231,25 +150,22 @@ class TestIntegrationScenarios:
         activity = "Soccer"
         
         # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(f"/activities/{activity}/signup", params={"email": email})
         assert signup_response.status_code == 200
         
         # Verify count increased
-        after_signup = client.get("/activities")
-        after_signup_count = len(after_signup.json()[activity]["participants"])
+        after_signup_count = len(activities[activity]["participants"])
         assert after_signup_count == initial_count + 1
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        unregister_response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
         assert unregister_response.status_code == 200
         
         # Verify count back to original
-        after_unregister = client.get("/activities")
-        after_unregister_count = len(after_unregister.json()[activity]["participants"])
+        after_unregister_count = len(activities[activity]["participants"])
         assert after_unregister_count == initial_count
     
     def test_multiple_signups_different_activities(self, client):
@@ -260,10 +176,9 @@ class TestIntegrationScenarios:
         activities_to_join = ["Basketball", "Soccer", "Art Club"]
         
         for activity in activities_to_join:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
+            response = client.post(f"/activities/{activity}/signup", params={"email": email})
             assert response.status_code == 200
         
         # Verify participant is in all activities
-        all_activities = client.get("/activities").json()
         for activity in activities_to_join:
-            assert email in all_activities[activity]["participants"]
+            assert email in activities[activity]["participants"]